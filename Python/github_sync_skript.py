@@ -10,11 +10,32 @@ TODO: Skriptbeschreibung einfügen
 #       einem Fehler abbrechen.
 
 import argparse
+import atexit
 import os
+import re
+import shutil
 import sys
 import subprocess
-from pathlib import Path
-from datetime import datetime
+import threading
+import time
+
+
+# ANSI-Farbcodes für die Konsolenausgabe, einmalig beim Import festgelegt.
+# Wird die Ausgabe umgeleitet (Pipe, Datei, Cron), bleiben die Codes leer,
+# damit keine Escape-Sequenzen in Logs und nachgelagerten Tools landen.
+if sys.stdout.isatty():
+    RED = '\033[31m'
+    GREEN = '\033[32m'
+    YELLOW = '\033[33m'
+    RESET = '\033[0m'
+else:
+    RED = GREEN = YELLOW = RESET = ''
+
+# Zeitstempel-Format für Log-Einträge und die automatische Commit-Message
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+
+# Trennlinie für die Start-/Abschluss-Banner von GitSync.sync()
+_SEPARATOR = "=" * 50
 
 
 class Logger:
@@ -29,10 +50,22 @@ class Logger:
         with Logger() as log:
             log.write_to_log_file("Nachricht", "Überschrift")
 
+    Innerhalb dieses Skripts wird die modulweite Instanz _LOGGER über die
+    Hilfsfunktion _log() verwendet (siehe unten).
+
     Attributes:
         _log_file_name (str): Pfad zur Log-Datei (default: "error.log")
+        _fd (int | None): Dateideskriptor der Log-Datei (O_APPEND). Wird beim
+                          ersten flush() mit Einträgen geöffnet, None solange
+                          nichts geschrieben wurde bzw. nach close().
+        _pending (list[tuple[float, str, str]]): Noch nicht geschriebene
+                          Einträge als (Zeitpunkt, Überschrift, Nachricht).
     """
 
+    # Feste Attributliste statt __dict__ pro Instanz: schnellerer Attributzugriff
+    # und weniger Speicher. Neue Attribute müssen hier ergänzt werden.
+    __slots__ = ('_log_file_name', '_fd', '_pending')
+
     def __init__(self, log_file_name: str = "error.log"):
         """
         Initialisiert den Logger mit einem Dateinamen.
@@ -45,12 +78,16 @@ class Logger:
             Das Präfix '_' markiert _log_file_name als protected (Konvention).
         """
         self._log_file_name = log_file_name
+        self._fd = None
+        self._pending = []
 
     def __enter__(self):
         """
         Wird beim Betreten des Context Managers aufgerufen.
 
-        Ermöglicht die Verwendung der 'with'-Anweisung.
+        Ermöglicht die Verwendung der 'with'-Anweisung. Die Log-Datei wird
+        erst geöffnet, wenn tatsächlich Einträge geschrieben werden, und danach
+        für alle weiteren Einträge wiederverwendet.
 
         Returns:
             Logger: Die Logger-Instanz selbst für die Verwendung im with-Block.
@@ -65,6 +102,7 @@ class Logger:
         """
         Wird beim Verlassen des Context Managers aufgerufen.
 
+        Schreibt alle gesammelten Einträge und schließt die Log-Datei über close().
         Gibt Exception-Details in der Konsole aus, falls eine Exception
         im with-Block aufgetreten ist. Die Exception wird anschließend
         weitergegeben (nicht unterdrückt).
@@ -79,23 +117,79 @@ class Logger:
                    True würde die Exception unterdrücken (nicht empfohlen!).
 
         Note:
-            Kein Cleanup nötig, da die Log-Datei in write_to_log_file()
-            bereits mit 'with open()' automatisch geschlossen wird.
+            Die Datei wird auch bei einer Exception geschlossen, da
+            __exit__() in jedem Fall aufgerufen wird.
         """
+        # Log-Datei schließen
+        self.close()
+
         # Prüfen, ob eine Exception aufgetreten ist
         if exc_type is not None:
             # Exception-Details rot formatiert in der Konsole ausgeben
-            print(f"\033[31mException im Logger-Context: {exc_type.__name__}: {exc_val}\033[0m")
+            print(f"{RED}Exception im Logger-Context: {exc_type.__name__}: {exc_val}{RESET}")
 
         # False = Exception wird weitergegeben (nicht unterdrücken)
         return False
 
+    def flush(self):
+        """
+        Formatiert alle gesammelten Einträge und schreibt sie in die Log-Datei.
+
+        Die Einträge aus write_to_log_file() werden erst hier formatiert
+        (Zeitstempel + Überschrift + Nachricht), zu einem Block zusammengefügt
+        und mit einem einzigen os.write() ans Ende der Datei angehängt.
+        Ohne gesammelte Einträge passiert nichts (die Datei wird nicht angelegt).
+
+        Example:
+            _LOGGER.flush()  # z.B. bevor der Benutzer ins Log schauen soll
+
+        Note:
+            - O_APPEND stellt sicher, dass die Datei nicht überschrieben
+              wird und jeder Block ans Ende angefügt wird.
+            - UTF-8 Encoding gewährleistet korrekte Darstellung von Umlauten.
+            - time.strftime() erzeugt den Zeitstempel ohne datetime-Objekt.
+        """
+        if not self._pending:
+            return
+
+        # Einträge formatieren: Zeitstempel aus dem beim Schreiben gemerkten Zeitpunkt
+        log_entries = [
+            f"===== {headline} ===== \n{time.strftime(_TS_FMT, time.localtime(created))} - {message}\n\n"
+            for created, headline, message in self._pending
+        ]
+
+        # Log-Datei beim ersten Flush öffnen
+        # os.open() statt open(): roher Dateideskriptor ohne Text-/Puffer-Schicht
+        # O_WRONLY = nur schreiben
+        # O_APPEND = jeder write() landet atomar am Dateiende (nicht überschreiben)
+        # O_CREAT  = Datei anlegen, falls sie noch nicht existiert (Rechte 0o644)
+        if self._fd is None:
+            self._fd = os.open(self._log_file_name, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+        # Alle Einträge als UTF-8-Bytes mit einem Aufruf in die Log-Datei schreiben
+        os.write(self._fd, ''.join(log_entries).encode('utf-8'))
+        self._pending.clear()
+
+    def close(self):
+        """
+        Schreibt gesammelte Einträge und schließt den Dateideskriptor.
+
+        Kann mehrfach aufgerufen werden. Ein späterer write_to_log_file()
+        öffnet die Datei beim nächsten flush() bei Bedarf erneut.
+        """
+        self.flush()
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
     def write_to_log_file(self, message: str, headline: str = "Error"):
         """
-        Schreibt einen formatierten Eintrag in die Log-Datei.
+        Merkt einen Eintrag für die Log-Datei vor.
 
-        Der Eintrag wird im Append-Modus ('a') ans Ende der Datei angefügt,
-        sodass vorherige Einträge erhalten bleiben. Jeder Eintrag enthält:
+        Der Eintrag wird zusammen mit dem aktuellen Zeitpunkt gesammelt und
+        erst bei flush() (spätestens beim Verlassen des with-Blocks bzw. bei
+        close()) formatiert und ans Ende der Datei angefügt. Jeder Eintrag enthält:
         - Eine Überschrift (z.B. "Error", "Warning", "Info")
         - Einen Zeitstempel (Format: YYYY-MM-DD HH:MM:SS)
         - Die eigentliche Nachricht
@@ -109,29 +203,43 @@ class Logger:
         Example:
             log.write_to_log_file("Datei nicht gefunden", "Warning")
 
-            # Erzeugt in error.log:
+            # Erzeugt in error.log (nach flush()):
             # ===== Warning =====
             # 2025-01-19 14:30:15 - Datei nicht gefunden
             #
 
         Note:
-            - Der Modus 'a' (append) stellt sicher, dass die Datei nicht
-              überschrieben wird und jeder Aufruf einen neuen Eintrag anfügt.
-            - UTF-8 Encoding gewährleistet korrekte Darstellung von Umlauten.
-            - Die Datei wird automatisch durch 'with' geschlossen.
+            - Der Zeitstempel entspricht dem Aufruf von write_to_log_file(),
+              nicht dem Zeitpunkt des Schreibens.
+            - Bei vielen Einträgen fallen so nur ein Format-Durchlauf und
+              ein einziger os.write() an.
         """
-        # Aktuellen Zeitstempel generieren
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # Nur Zeitpunkt (schneller C-Aufruf) und Rohdaten merken, formatiert wird in flush()
+        self._pending.append((time.time(), headline, message))
+
+
+# Modulweite Logger-Instanz für alle Fehler-/Warnungspfade dieses Skripts.
+# Statt pro Eintrag einen neuen Logger zu erzeugen und einen with-Block zu
+# betreten, teilen sich alle Aufrufe ein Objekt und einen Dateideskriptor.
+_LOGGER = Logger()
 
-        # Formatierte Log-Nachricht mit Überschrift, Zeitstempel und Nachricht erstellen
-        log_entry = f"===== {headline} ===== \n{timestamp} - {message}\n\n"
+# Gesammelte Einträge spätestens beim Beenden des Interpreters schreiben
+# (auch bei sys.exit() und unbehandelten Exceptions)
+atexit.register(_LOGGER.close)
 
-        # Datei im Append-Modus öffnen und Eintrag hinzufügen
-        # 'a' = append (anhängen, nicht überschreiben)
-        # encoding='utf-8' = Umlaute und Sonderzeichen korrekt speichern
-        # 'with' = Datei wird automatisch geschlossen, auch bei Fehlern
-        with open(self._log_file_name, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+
+def _log(message: str, headline: str = "Error"):
+    """
+    Schreibt einen Eintrag über die modulweite Logger-Instanz _LOGGER.
+
+    Args:
+        message (str): Die zu protokollierende Nachricht.
+        headline (str): Kategorisierung des Eintrags (default: "Error").
+
+    Example:
+        _log(f"Git Pull Fehler:\n{error}", "GitSync Error")
+    """
+    _LOGGER.write_to_log_file(message, headline)
 
 
 class EnvLoader:
@@ -156,8 +264,19 @@ class EnvLoader:
     Attributes:
         _env_vars (dict): Dictionary zum Speichern der geladenen Variablen.
                          Key = Variablenname, Value = Variablenwert
+        _LINE_RE (re.Pattern): Vorkompilierter Ausdruck für eine .env-Zeile
+                              (Klassenattribut, für alle Instanzen gleich).
     """
 
+    # Regulärer Ausdruck für eine Zeile der .env-Datei: KEY=VALUE
+    # - Gruppe 1: Variablenname (Buchstaben, Ziffern, '_', nicht mit Ziffer beginnend)
+    # - Gruppe 2: öffnendes Anführungszeichen (', ") oder leer
+    # - Gruppe 3: Wert; \2 verlangt dasselbe Zeichen als Abschluss, dadurch wird
+    #             nur ein passendes Paar Anführungszeichen entfernt
+    # Umgebende Leerzeichen werden ebenfalls im Ausdruck übersprungen.
+    # Wird einmalig beim Import kompiliert und für jede Zeile wiederverwendet.
+    _LINE_RE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(["\']?)(.*?)\2\s*$')
+
     def __init__(self):
         """
         Initialisiert den EnvLoader mit einem leeren Dictionary.
@@ -172,7 +291,7 @@ class EnvLoader:
 
     def load_env_file(self, env_path: str) -> bool:
         """
-        Die Methode liest die angegebene .env-Datei zeilenweise, parst
+        Die Methode liest die angegebene .env-Datei in einem Stück ein, parst
         Key-Value-Paare und speichert sie im internen Dictionary.
         Fehler werden in der Konsole ausgegeben und geloggt.
 
@@ -180,7 +299,8 @@ class EnvLoader:
         - Leerzeilen werden ignoriert
         - Zeilen mit '#' am Anfang werden als Kommentare ignoriert
         - Format: KEY=VALUE (Leerzeichen um '=' werden entfernt)
-        - Anführungszeichen (', ") um Values werden entfernt
+        - KEY muss ein gültiger Variablenname sein (z.B. REPO_PFAD_LIN)
+        - Ein passendes Paar Anführungszeichen (', ") um Values wird entfernt
 
         Args:
             env_path (str): Pfad zur .env-Datei (relativ oder absolut).
@@ -203,56 +323,48 @@ class EnvLoader:
             - Erfolg wird grün ausgegeben
             - Alle Fehler werden zusätzlich in die Log-Datei geschrieben
         """
-        if not os.path.exists(env_path):
-            # Warnung in Gelb ausgeben
-            print(f"\033[33mWARNUNG: .env-Datei nicht gefunden unter: {env_path}\033[0m")
-
-            with Logger() as log:
-                log.write_to_log_file(f".env-Datei nicht gefunden unter: {env_path}", "EnvLoader Warning")
-
-            return False
-
         try:
             # .env-Datei mit UTF-8 Encoding öffnen
             # 'r' = read-only Modus
             # encoding='utf-8' = Umlaute und Sonderzeichen korrekt lesen
+            # read() liest die (kleine) Datei in einem Rutsch, statt zeilenweise
             with open(env_path, 'r', encoding='utf-8') as file:
-                # Jede Zeile der Datei durchgehen
-                for line in file:
-                    # Leerzeichen/Tabs am Anfang und Ende entfernen
-                    line = line.strip()
-
-                    # Prüfen, ob Zeile gültig ist:
-                    # - Nicht leer
-                    # - Kein Kommentar (startet nicht mit '#')
-                    # - Enthält '=' (Key-Value-Trenner)
-                    if line and not line.startswith('#') and '=' in line:
-                        # Zeile bei erstem '=' in Key und Value aufteilen
-                        # maxsplit=1 verhindert, dass '=' im Value selbst als Trenner gilt
-                        key, value = line.split('=', 1)
-
-                        # Leerzeichen um Key und Value entfernen
-                        key = key.strip()
-
-                        # Leerzeichen entfernen und Anführungszeichen (', ") am Anfang/Ende entfernen
-                        # strip('"').strip("'") entfernt beide Arten von Anführungszeichen
-                        value = value.strip().strip('"').strip("'")
-
-                        # Key-Value-Paar im Dictionary speichern
-                        self._env_vars[key] = value
-            return True
+                data = file.read()
 
-        except Exception as e:
+        except FileNotFoundError:
+            # Datei existiert nicht. Kein separates os.path.exists() vorab,
+            # open() meldet das ohnehin (spart einen stat()-Aufruf).
+            # Warnung in Gelb ausgeben
+            print(f"{YELLOW}WARNUNG: .env-Datei nicht gefunden unter: {env_path}{RESET}")
+
+            _log(f".env-Datei nicht gefunden unter: {env_path}", "EnvLoader Warning")
+
+            return False
+
+        except (OSError, UnicodeDecodeError) as e:
             # Fehler beim Lesen der Datei (z.B. Encoding-Problem, Zugriffsverweigerung)
             # Fehlermeldung rot in der Konsole ausgeben
-            print(f"\033[31mFEHLER beim Lesen der .env-Datei: {e}\033[0m")
+            print(f"{RED}FEHLER beim Lesen der .env-Datei: {e}{RESET}")
 
             # Fehler in Log-Datei schreiben
-            with Logger() as log:
-                log.write_to_log_file(f"FEHLER beim Lesen der .env-Datei:\n{e}", "EnvLoader Error")
+            _log(f"FEHLER beim Lesen der .env-Datei:\n{e}", "EnvLoader Error")
 
             return False
 
+        # Parsen außerhalb des try-Blocks: nur das Lesen der Datei kann fehlschlagen
+        # Alle Zeilen gegen KEY=VALUE prüfen und in einem Schritt ein Dictionary bauen.
+        # Leerzeilen, Kommentare ('#') und ungültige Zeilen matchen nicht und
+        # fallen automatisch heraus. Der := Operator merkt sich das Match-Objekt.
+        parsed = {
+            match.group(1): match.group(3)
+            for line in data.splitlines()
+            if (match := self._LINE_RE.match(line))
+        }
+
+        # Alle Key-Value-Paare auf einmal ins Dictionary übernehmen
+        self._env_vars.update(parsed)
+        return True
+
     def get_var(self, key: str, default: str = None) -> str | None:
         """
         Gibt den Wert einer geladenen Umgebungsvariable zurück.
@@ -288,6 +400,16 @@ class EnvLoader:
         return self._env_vars.get(key, default)
 
 
+# Feste Git-Befehle als unveränderliche Tupel, einmalig beim Import angelegt.
+# Der erste Eintrag 'git' wird in GitSync._run_git_command() durch den
+# aufgelösten Pfad der Git-Binary ersetzt.
+_CMD_PULL = ('git', 'pull')
+_CMD_ADD = ('git', 'add', '.')
+_CMD_PUSH = ('git', 'push')
+_CMD_STATUS = ('git', '--no-optional-locks', 'status', '--porcelain=v1', '-z', '--untracked-files=normal')
+_CMD_AHEAD = ('git', 'rev-list', '--count', '@{upstream}..HEAD')
+
+
 class GitSync:
     """
     Diese Klasse implementiert einen sicheren Git-Sync-Prozess:
@@ -305,11 +427,13 @@ class GitSync:
         git.sync(commit_message='Update')
 
     Attributes:
-        _repo_path (Path): Pfad zum Git-Repository als Path-Objekt.
-                          Das Präfix '_' markiert es als protected.
+        _repo_path (str): Pfad zum Git-Repository als String.
+                         Das Präfix '_' markiert es als protected.
+        _git_executable (str): Absoluter Pfad zur Git-Binary (einmalig per
+                               shutil.which() aufgelöst, Fallback: 'git').
 
     Raises:
-        ValueError: Wenn der angegebene Repository-Pfad nicht existiert.
+        ValueError: Wenn der angegebene Repository-Pfad kein Verzeichnis ist.
 
     Note:
         - Alle Git-Befehle werden im Repository-Verzeichnis (_repo_path) ausgeführt
@@ -321,8 +445,8 @@ class GitSync:
         """
         Initialisiert GitSync mit dem Repository-Pfad.
 
-        Konvertiert den übergebenen String-Pfad in ein Path-Objekt und
-        validiert die Existenz des Verzeichnisses. Dies verhindert, dass
+        Speichert den übergebenen Pfad als String und prüft, ob es sich um
+        ein existierendes Verzeichnis handelt. Dies verhindert, dass
         Git-Befehle auf nicht existierenden Pfaden ausgeführt werden.
 
         Args:
@@ -332,7 +456,7 @@ class GitSync:
                             - Absolut: '/home/user/repos/project'
 
         Raises:
-            ValueError: Wenn der Pfad nicht existiert.
+            ValueError: Wenn der Pfad nicht existiert oder kein Verzeichnis ist.
                        Die Exception wird mit einer aussagekräftigen
                        Fehlermeldung geworfen, die den fehlenden Pfad enthält.
 
@@ -344,20 +468,28 @@ class GitSync:
             git = GitSync('./repos/project')
 
         Note:
-            - Path() aus pathlib bietet plattformübergreifende Pfadoperationen
-            - exists() prüft nur die Existenz, nicht ob es ein Git-Repo ist
+            - Der Pfad wird nur an 'git -C' übergeben, ein Path-Objekt ist
+              dafür nicht nötig (os.fspath() akzeptiert auch Path-Objekte)
+            - isdir() prüft nur, ob es ein Verzeichnis ist, nicht ob es ein Git-Repo ist
             - Git-Validierung erfolgt erst bei der Ausführung von Git-Befehlen
         """
-        # String-Pfad in Path-Objekt konvertieren für bessere Pfadoperationen
-        self._repo_path = Path(repo_path)
+        # Pfad als String speichern (Path-Objekte werden per os.fspath() umgewandelt)
+        self._repo_path = os.fspath(repo_path)
 
-        # Prüfen, ob der Pfad existiert (Verzeichnis oder Datei)
-        if not self._repo_path.exists():
+        # Prüfen, ob der Pfad ein existierendes Verzeichnis ist
+        # isdir() ist False für nicht existierende Pfade und für Dateien
+        if not os.path.isdir(self._repo_path):
             # ValueError werfen mit aussagekräftiger Fehlermeldung
             # Diese Exception sollte vom Aufrufer gefangen werden
-            raise ValueError(f"Repository-Pfad existiert nicht: {repo_path}")
+            raise ValueError(f"Repository-Pfad existiert nicht oder ist kein Verzeichnis: {repo_path}")
 
-    def _run_git_command(self, command: list[str]) -> tuple[bool, str, str]:
+        # Git-Binary einmalig auflösen. Ein absoluter Pfad ist Voraussetzung dafür,
+        # dass subprocess auf Linux den schnellen posix_spawn()-Pfad nutzen kann.
+        # Ist Git nicht im PATH, bleibt es bei 'git' und der Fehler (FileNotFoundError)
+        # wird wie bisher von _run_git_command() als Fehler-Tuple zurückgegeben.
+        self._git_executable = shutil.which('git') or 'git'
+
+    def _run_git_command(self, command: list[str] | tuple[str, ...], capture_stdout: bool = True) -> tuple[bool, str, str]:
         """
         Führt einen Git-Befehl aus und gibt das Ergebnis zurück.
 
@@ -368,18 +500,23 @@ class GitSync:
         Das Präfix '_' markiert diese Methode als intern (nicht für externe Nutzung).
 
         Args:
-            command (list[str]): Git-Befehl als Liste von Strings.
-                                Der erste String ist immer 'git', gefolgt von
-                                Subcommand und Optionen.
+            command (list[str] | tuple[str, ...]): Git-Befehl als Liste oder
+                                Tupel von Strings. Der erste String ist immer
+                                'git', gefolgt von Subcommand und Optionen.
                                 Beispiele:
                                 - ['git', 'status']
-                                - ['git', 'pull', 'origin', 'main']
                                 - ['git', 'commit', '-m', 'message']
+                                - _CMD_PULL (feste Befehle als Modulkonstante)
+            capture_stdout (bool): Ob stdout erfasst werden soll (default: True).
+                                   Bei False wird stdout nach os.devnull
+                                   verworfen; sinnvoll für Befehle, deren
+                                   Ausgabe nicht verwendet wird (add, push).
 
         Returns:
             tuple[bool, str, str]: Tuple mit drei Elementen:
                 - bool: True bei Erfolg (returncode 0), False bei Fehler
                 - str: Standardausgabe (stdout) des Git-Befehls
+                       ("" bei capture_stdout=False)
                 - str: Fehlerausgabe (stderr) des Git-Befehls
 
         Example:
@@ -390,9 +527,19 @@ class GitSync:
                 print(f"Fehler: {error}")
 
         Note:
-            - cwd=self._repo_path führt den Befehl im Repository-Ordner aus
-            - capture_output=True erfasst stdout und stderr getrennt
-            - text=True gibt Strings statt Bytes zurück (encoding='utf-8')
+            - 'git' wird durch den absoluten Pfad aus _git_executable ersetzt
+            - '-C <repo>' lässt Git selbst ins Repository wechseln, statt cwd=
+              zu setzen (kein chdir() im Kindprozess nötig)
+            - Absoluter Pfad, kein cwd und close_fds=False erlauben subprocess
+              den posix_spawn()-Pfad statt fork()+exec(). close_fds=False ist
+              unkritisch, da Python-Dateideskriptoren standardmäßig nicht
+              vererbbar sind (PEP 446).
+            - stderr wird immer erfasst, stdout nur bei capture_stdout=True
+              (spart sonst eine Pipe und deren Auslesen)
+            - Ausgaben werden als Bytes gelesen und einmalig als UTF-8
+              dekodiert. errors='replace' verhindert einen UnicodeDecodeError,
+              wenn Git Bytes ausgibt, die kein gültiges UTF-8 sind
+              (z.B. Dateinamen in anderer Kodierung).
             - check=False verhindert Exception bei Non-Zero-Exit-Code
             - Wir prüfen returncode manuell für bessere Fehlerkontrolle
             - Exceptions (z.B. FileNotFoundError wenn Git fehlt) werden gefangen
@@ -400,27 +547,109 @@ class GitSync:
         Raises:
             Keine Exception nach außen. Fehler werden als Tuple zurückgegeben.
         """
+        # 'git' durch den aufgelösten Pfad ersetzen und das Repository per -C angeben
+        argv = [self._git_executable, '-C', self._repo_path, *command[1:]]
+
         try:
             # subprocess.run() führt den Befehl aus
             result = subprocess.run(
-                command,                   # Git-Befehl als Liste
-                cwd=self._repo_path,       # Working Directory = Repository-Pfad
-                capture_output=True,       # stdout und stderr erfassen
-                text=True,                 # String-Output statt Bytes
+                argv,                      # Git-Befehl als Liste
+                close_fds=False,           # Voraussetzung für posix_spawn()
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,    # stderr immer erfassen (Fehlermeldungen)
                 check=False                # Keine Exception bei Non-Zero-Exit
             )
 
             # returncode == 0 bedeutet Erfolg bei Unix-Tools
             success = result.returncode == 0
 
+            # Bytes einmalig nach UTF-8 dekodieren
+            # Ohne Erfassung ist result.stdout None → leerer String
+            output = result.stdout.decode('utf-8', 'replace') if result.stdout else ""
+            error = result.stderr.decode('utf-8', 'replace')
+
             # Tuple mit (Erfolg, Stdout, Stderr) zurückgeben
-            return success, result.stdout, result.stderr
+            return success, output, error
 
         except Exception as e:
             # Exception (z.B. Git nicht installiert, Pfad nicht zugänglich)
             # Als Fehler-Tuple zurückgeben: (False, "", Exception-Message)
             return False, "", str(e)
 
+    def _report_failure(self, step: str, error: str):
+        """
+        Meldet einen fehlgeschlagenen Git-Schritt in Konsole und Log-Datei.
+
+        Gemeinsame Fehlerausgabe von pull(), add_all(), commit() und push():
+        rote Konsolenzeile mit der Git-Fehlermeldung und ein Eintrag
+        "Git <Schritt> Fehler" mit der vollständigen Meldung im Log.
+
+        Args:
+            step (str): Name des Schritts für die Ausgabe (z.B. 'Pull').
+            error (str): Fehlerausgabe (stderr) des Git-Befehls.
+
+        Example:
+            self._report_failure('Push', error)
+            # Konsole: ✗ Push fehlgeschlagen: <stderr>
+            # Log:     ===== GitSync Error ===== ... Git Push Fehler: <stderr>
+        """
+        print(f"{RED}✗ {step} fehlgeschlagen:{RESET} {error.strip()}")
+        _log(f"Git {step} Fehler:\n{error}", "GitSync Error")
+
+    def _has_local_changes(self) -> bool:
+        """
+        Prüft mit git status, ob lokale Änderungen vorliegen.
+
+        Führt 'git --no-optional-locks status --porcelain=v1 -z
+        --untracked-files=normal' aus. Das Porcelain-Format gibt pro geänderter,
+        neuer oder gelöschter Datei einen Eintrag aus und bleibt leer, wenn der
+        Working Tree sauber ist.
+
+        Returns:
+            bool: True, wenn Änderungen vorliegen oder der Status nicht
+                 ermittelt werden konnte, False bei sauberem Working Tree.
+
+        Note:
+            - Im Fehlerfall wird True zurückgegeben, damit add_all() und
+              commit() wie gewohnt laufen und den Fehler selbst melden
+            - Dateien aus .gitignore werden von Git nicht gelistet
+            - --untracked-files=normal: neue Dateien werden unabhängig von
+              der Einstellung status.showUntrackedFiles gelistet. 'git add .'
+              ignoriert diese Einstellung ebenfalls; ohne den Schalter würde
+              eine neue Datei bei showUntrackedFiles=no nie committet.
+            - --no-optional-locks: status aktualisiert den Index sonst
+              nebenbei und nimmt dafür .git/index.lock. Das ist hier unnötig
+              und kann mit parallel laufenden Git-Prozessen kollidieren.
+        """
+        success, output, _ = self._run_git_command(_CMD_STATUS)
+
+        # Leere Ausgabe = nichts zu stagen/committen
+        return not success or len(output) > 0
+
+    def _needs_push(self) -> bool:
+        """
+        Prüft mit git rev-list, ob lokale Commits noch nicht gepusht wurden.
+
+        Führt 'git rev-list --count @{upstream}..HEAD' aus. Die Ausgabe ist
+        die Anzahl der Commits, die lokal vorhanden, im Remote-Tracking-Branch
+        aber noch nicht enthalten sind.
+
+        Returns:
+            bool: True, wenn mindestens ein Commit aussteht oder die Anzahl
+                 nicht ermittelt werden konnte, False wenn nichts zu pushen ist.
+
+        Note:
+            - Ohne konfigurierten Upstream schlägt der Befehl fehl. Dann wird
+              True zurückgegeben und push() meldet den eigentlichen Fehler.
+            - Vergleicht mit dem lokalen Stand von @{upstream}, kein Netzwerkzugriff
+        """
+        success, output, _ = self._run_git_command(_CMD_AHEAD)
+
+        if not success:
+            return True
+
+        return output.strip() != '0'
+
     def pull(self) -> bool:
         """
         Holt Remote-Änderungen mit git pull.
@@ -446,9 +675,9 @@ class GitSync:
                 return False
 
         Note:
-            - Fehler werden rot (\033[31m) in der Konsole ausgegeben
+            - Fehler werden rot (RED) in der Konsole ausgegeben
             - Fehler werden zusätzlich in die Log-Datei geschrieben
-            - Erfolg wird grün (\033[32m) ausgegeben
+            - Erfolg wird grün (GREEN) ausgegeben
             - Bei Merge-Konflikten stoppt der Pull und gibt False zurück
             - 🔄 Emoji als visueller Indikator für laufende Operation
             - ✓ / ✗ als Erfolgs-/Fehler-Indikatoren
@@ -457,20 +686,16 @@ class GitSync:
         print("🔄 Pulling remote changes...")
 
         # Git-Pull-Befehl ausführen
-        success, output, error = self._run_git_command(['git', 'pull'])
+        success, output, error = self._run_git_command(_CMD_PULL)
 
         if success:
             # Erfolg: Grüne Ausgabe mit Git-Output
             # strip() entfernt Leerzeilen am Ende
-            print(f"\033[32m✓ Pull erfolgreich:\033[0m {output.strip()}")
+            print(f"{GREEN}✓ Pull erfolgreich:{RESET} {output.strip()}")
             return True
         else:
-            # Fehler: Rote Ausgabe mit Git-Error
-            print(f"\033[31m✗ Pull fehlgeschlagen:\033[0m {error.strip()}")
-
-            # Fehler in Log-Datei schreiben für spätere Analyse
-            with Logger() as log:
-                log.write_to_log_file(f"Git Pull Fehler:\n{error}", "GitSync Error")
+            # Fehler: Rote Ausgabe mit Git-Error und Eintrag in der Log-Datei
+            self._report_failure('Pull', error)
             return False
 
     def add_all(self) -> bool:
@@ -515,20 +740,17 @@ class GitSync:
 
         # Git-Add-Befehl ausführen
         # '.' bedeutet: alle Änderungen im Repository
-        success, output, error = self._run_git_command(['git', 'add', '.'])
+        # stdout wird nicht benötigt → verwerfen statt erfassen
+        success, output, error = self._run_git_command(_CMD_ADD, capture_stdout=False)
 
         if success:
             # Erfolg: Kurze grüne Bestätigung
             # Keine detaillierte Ausgabe nötig, da 'git add .' meist silent ist
-            print("\033[32m✓ Changes staged\033[0m")
+            print(f"{GREEN}✓ Changes staged{RESET}")
             return True
         else:
-            # Fehler: Rote Ausgabe mit Git-Error
-            print(f"\033[31m✗ Add fehlgeschlagen:\033[0m {error.strip()}")
-
-            # Fehler in Log-Datei schreiben
-            with Logger() as log:
-                log.write_to_log_file(f"Git Add Fehler:\n{error}", "GitSync Error")
+            # Fehler: Rote Ausgabe mit Git-Error und Eintrag in der Log-Datei
+            self._report_failure('Add', error)
             return False
 
     def commit(self, message: str) -> bool:
@@ -578,25 +800,21 @@ class GitSync:
 
         if success:
             # Erfolg: Grüne Ausgabe mit Git-Output (enthält Commit-Hash und Statistik)
-            print(f"\033[32m✓ Commit erfolgreich:\033[0m {output.strip()}")
+            print(f"{GREEN}✓ Commit erfolgreich:{RESET} {output.strip()}")
             return True
 
         # Spezialfall: Nichts zu committen (kein Fehler!)
         # Git gibt "nothing to commit" in stdout ODER stderr aus
         elif "nothing to commit" in output.lower() or "nothing to commit" in error.lower():
             # Gelbe Warnung ausgeben (kein Fehler, aber wichtige Info)
-            print("\033[33m⚠ Keine Änderungen zum Committen\033[0m")
+            print(f"{YELLOW}⚠ Keine Änderungen zum Committen{RESET}")
             # True zurückgeben, da dies kein Fehler ist
             return True
 
         else:
-            # Echter Fehler: Rote Ausgabe
+            # Echter Fehler: Rote Ausgabe und Eintrag in der Log-Datei
             # Mögliche Ursachen: Fehlende Git-Config, ungültige Zeichen in Message
-            print(f"\033[31m✗ Commit fehlgeschlagen:\033[0m {error.strip()}")
-
-            # Fehler in Log-Datei schreiben
-            with Logger() as log:
-                log.write_to_log_file(f"Git Commit Fehler:\n{error}", "GitSync Error")
+            self._report_failure('Commit', error)
             return False
 
     def push(self) -> bool:
@@ -636,20 +854,17 @@ class GitSync:
         print("⬆️  Pushing changes to remote...")
 
         # Git-Push-Befehl ausführen
-        success, output, error = self._run_git_command(['git', 'push'])
+        # stdout wird nicht benötigt (Fortschritt/Fehler kommen über stderr) → verwerfen
+        success, output, error = self._run_git_command(_CMD_PUSH, capture_stdout=False)
 
         if success:
             # Erfolg: Grüne Ausgabe mit Git-Output (enthält Branch-Info)
-            print(f"\033[32m✓ Push erfolgreich\033[0m")
+            print(f"{GREEN}✓ Push erfolgreich{RESET}")
             return True
         else:
-            # Fehler: Rote Ausgabe mit Git-Error
+            # Fehler: Rote Ausgabe mit Git-Error und Eintrag in der Log-Datei
             # Häufig: "remote is ahead", "authentication failed", "no upstream"
-            print(f"\033[31m✗ Push fehlgeschlagen:\033[0m {error.strip()}")
-
-            # Fehler in Log-Datei schreiben für spätere Analyse
-            with Logger() as log:
-                log.write_to_log_file(f"Git Push Fehler:\n{error}", "GitSync Error")
+            self._report_failure('Push', error)
             return False
 
     def sync(self, commit_message: str = "Auto-sync") -> bool:
@@ -680,6 +895,12 @@ class GitSync:
         Der Workflow stoppt beim ersten Fehler (Fail-Fast-Prinzip).
         Alle nachfolgenden Schritte werden übersprungen.
 
+        Schritte ohne Arbeit werden ausgelassen: Add und Commit nur bei
+        lokalen Änderungen (_has_local_changes), Push nur bei ungepushten
+        Commits (_needs_push). Die Prüfung auf lokale Änderungen läuft in
+        einem Hintergrund-Thread parallel zum Pull; findet sie nichts, wird
+        nach dem Pull noch einmal geprüft.
+
         Args:
             commit_message (str): Commit-Nachricht für den Commit-Schritt.
                                  Default: 'Auto-sync'
@@ -694,7 +915,7 @@ class GitSync:
                 print('Sync erfolgreich!')
 
             # Mit eigener Message:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = time.strftime(_TS_FMT)
             if git.sync(f'Daily backup {timestamp}'):
                 print('Backup erfolgreich!')
 
@@ -703,49 +924,78 @@ class GitSync:
             - Fehler werden in der Konsole (rot) und im Log ausgegeben
             - Pull zuerst ist wichtig! Verhindert Push-Konflikte
             - Bei "nothing to commit" wird der Workflow fortgesetzt
+            - Ohne lokale Änderungen/neue Commits werden Add, Commit und Push
+              übersprungen (gelbe Hinweise, kein Fehler)
             - Die Methode gibt detailliertes visuelles Feedback mit Emojis
             - Separatoren (===) erleichtern die Lesbarkeit im Terminal
         """
-        # Visueller Separator: Sync-Start markieren
-        print("\n" + "=" * 50)
-        print("🔄 Starte Git-Sync-Workflow...")
-        print("=" * 50 + "\n")
+        # Visueller Separator: Sync-Start markieren (ein print() statt drei)
+        print(f"\n{_SEPARATOR}\n🔄 Starte Git-Sync-Workflow...\n{_SEPARATOR}\n")
+
+        # Lokale Änderungen parallel zum Pull prüfen (eigener Thread)
+        # → Der Pull wartet meist auf das Netzwerk, git status ist rein lokal
+        # → status läuft mit --no-optional-locks und blockiert den Pull nicht
+        # → Ein "Änderungen vorhanden" gilt auch nach dem Pull (lokale Änderungen
+        #   bleiben erhalten). Schlimmstenfalls meldet status eine Datei, die der
+        #   Pull gerade aktualisiert; dann laufen Add/Commit ohne Wirkung durch.
+        # → Ein "keine Änderungen" ist dagegen NICHT verlässlich: mit
+        #   rebase.autoStash/merge.autoStash stasht der Pull lokale Änderungen
+        #   vorübergehend weg. Dann wird nach dem Pull erneut geprüft.
+        # → Add darf NICHT parallel laufen, da der Pull den Working Tree ändert
+        # threading wird ohnehin von subprocess importiert (keine Importkosten)
+        probe_result = []
+        probe = threading.Thread(target=lambda: probe_result.append(self._has_local_changes()))
+        probe.start()
 
         # Schritt 1: Pull (Remote-Änderungen holen)
         # → WICHTIG: Pull zuerst! Verhindert Konflikte beim Push
-        if not self.pull():
+        pull_ok = self.pull()
+
+        # Auf das Ergebnis von git status warten (meist längst fertig)
+        probe.join()
+
+        if not pull_ok:
             # Pull fehlgeschlagen → Workflow abbrechen
             # Rote Fehlerausgabe mit Emoji für bessere Sichtbarkeit
-            print("\n\033[31m❌ Sync abgebrochen (Pull fehlgeschlagen)\033[0m\n")
+            print(f"\n{RED}❌ Sync abgebrochen (Pull fehlgeschlagen){RESET}\n")
             return False  # Fail-Fast: Kein weiterer Schritt wird ausgeführt
 
-        # Schritt 2: Add (Alle Änderungen stagen)
-        # → Bereitet alle Änderungen für den Commit vor
-        if not self.add_all():
-            # Add fehlgeschlagen → Workflow abbrechen
-            print("\n\033[31m❌ Sync abgebrochen (Add fehlgeschlagen)\033[0m\n")
-            return False
+        # Nur ein positives Ergebnis übernehmen, sonst nach dem Pull erneut prüfen
+        has_local_changes = (probe_result and probe_result[0]) or self._has_local_changes()
+
+        # Schritt 2+3 nur, wenn es lokale Änderungen gibt
+        # → Spart auf dem häufigen "nichts geändert"-Pfad zwei Git-Aufrufe
+        if has_local_changes:
+            # Schritt 2: Add (Alle Änderungen stagen)
+            # → Bereitet alle Änderungen für den Commit vor
+            if not self.add_all():
+                # Add fehlgeschlagen → Workflow abbrechen
+                print(f"\n{RED}❌ Sync abgebrochen (Add fehlgeschlagen){RESET}\n")
+                return False
 
-        # Schritt 3: Commit (Änderungen committen)
-        # → Speichert Änderungen lokal mit der angegebenen Message
-        # → Bei "nothing to commit" gibt commit() True zurück (kein Fehler)
-        if not self.commit(commit_message):
-            # Commit fehlgeschlagen → Workflow abbrechen
-            print("\n\033[31m❌ Sync abgebrochen (Commit fehlgeschlagen)\033[0m\n")
-            return False
+            # Schritt 3: Commit (Änderungen committen)
+            # → Speichert Änderungen lokal mit der angegebenen Message
+            # → Bei "nothing to commit" gibt commit() True zurück (kein Fehler)
+            if not self.commit(commit_message):
+                # Commit fehlgeschlagen → Workflow abbrechen
+                print(f"\n{RED}❌ Sync abgebrochen (Commit fehlgeschlagen){RESET}\n")
+                return False
+        else:
+            print(f"{YELLOW}⚠ Keine lokalen Änderungen - Add/Commit übersprungen{RESET}")
 
         # Schritt 4: Push (Änderungen hochladen)
         # → Macht lokale Commits im Remote verfügbar
         # → Kann fehlschlagen wenn Remote ahead ist (Pull erforderlich)
-        if not self.push():
+        # → Wird übersprungen, wenn keine ungepushten Commits vorliegen
+        if not self._needs_push():
+            print(f"{YELLOW}⚠ Keine neuen Commits - Push übersprungen{RESET}")
+        elif not self.push():
             # Push fehlgeschlagen → Workflow abbrechen
-            print("\n\033[31m❌ Sync abgebrochen (Push fehlgeschlagen)\033[0m\n")
+            print(f"\n{RED}❌ Sync abgebrochen (Push fehlgeschlagen){RESET}\n")
             return False
 
-        # Alle Schritte erfolgreich! Erfolgs-Ausgabe mit visuellem Feedback
-        print("\n" + "=" * 50)
-        print("\033[32m✓ Git-Sync erfolgreich abgeschlossen!\033[0m")
-        print("=" * 50 + "\n")
+        # Alle Schritte erfolgreich! Erfolgs-Ausgabe mit visuellem Feedback (ein print())
+        print(f"\n{_SEPARATOR}\n{GREEN}✓ Git-Sync erfolgreich abgeschlossen!{RESET}\n{_SEPARATOR}\n")
 
         # True = Gesamter Workflow erfolgreich
         return True
@@ -755,14 +1005,14 @@ def main():
     env = EnvLoader()
 
     if not env.load_env_file('.env'):
-        print("\033[31mFEHLER: .env-Datei konnte nicht geladen werden.\033[0m")
+        print(f"{RED}FEHLER: .env-Datei konnte nicht geladen werden.{RESET}")
         # Programm beenden. Exit-Code 1 signalisiert Fehler für das aufrufende Shell/CI
         sys.exit(1)
 
     repo_path = env.get_var('REPO_PFAD_LIN')
 
     if repo_path is None:
-        print("\033[31mFEHLER: REPO_PFAD_LIN nicht in der .env-Datei gefunden.\033[0m")
+        print(f"{RED}FEHLER: REPO_PFAD_LIN nicht in der .env-Datei gefunden.{RESET}")
         # Programm beenden. Exit-Code 1 signalisiert Fehler für das aufrufende Shell/CI
         sys.exit(1)
 
@@ -790,13 +1040,13 @@ def main():
     if args.pull_only:
         print("🔄 Nur Pull ausführen...")
         if git.pull() == False:
-            print("\033[31m✗ Pull fehlgeschlagen - siehe Logs für Details\033[0m")
+            print(f"{RED}✗ Pull fehlgeschlagen - siehe Logs für Details{RESET}")
             # Programm beenden. Exit-Code 1 signalisiert Fehler für das aufrufende Shell/CI
             sys.exit(1)
     else:
         print("🔄 Vollständigen Git-Sync ausführen...")
-        if git.sync("Automatischer Sync vom " + datetime.now().strftime('%Y-%m-%d %H:%M:%S')) == False:
-            print("\033[31m✗ Sync fehlgeschlagen - siehe Logs für Details\033[0m")
+        if git.sync("Automatischer Sync vom " + time.strftime(_TS_FMT)) == False:
+            print(f"{RED}✗ Sync fehlgeschlagen - siehe Logs für Details{RESET}")
             # Programm beenden. Exit-Code 1 signalisiert Fehler für das aufrufende Shell/CI
             sys.exit(1)
 
@@ -805,5 +1055,10 @@ if __name__ == "__main__":
     try:
         main()
     finally:
-        # Terminal offen halten
-        input("\nDrücke Enter zum Beenden...")
+        # Log-Einträge jetzt schreiben, damit sie schon während des Wartens sichtbar sind
+        _LOGGER.flush()
+
+        # Terminal offen halten, aber nur interaktiv (z.B. über das Starter-Skript).
+        # Unter Cron/CI gibt es kein Terminal: dort sofort beenden statt zu blockieren.
+        if sys.stdin.isatty():
+            input("\nDrücke Enter zum Beenden...")